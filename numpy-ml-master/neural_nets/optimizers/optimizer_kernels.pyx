@@ -0,0 +1,132 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+# distutils: extra_compile_args = -O3 -ffast-math -fopenmp
+# distutils: extra_link_args = -fopenmp
+"""
+Optional compiled versions of the fused optimizer update kernels for users
+who would rather build a small extension than take a Numba dependency.
+
+Build in place with
+
+    cythonize -i optimizer_kernels.pyx
+
+and `optimizers.py` will pick the compiled kernels up automatically. The
+signatures mirror the pure NumPy fallbacks: all kernels take 1D contiguous
+views and update `param` and the state buffers in place.
+"""
+
+from libc.math cimport sqrt
+from cython.parallel cimport prange
+
+ctypedef fused param_t:
+    float
+    double
+
+ctypedef fused state_t:
+    float
+    double
+
+
+def maybe_clip(param_t[::1] g, double clip_norm):
+    cdef Py_ssize_t i, n = g.shape[0]
+    cdef double ss = 0.0
+    cdef double scale
+
+    for i in prange(n, nogil=True):
+        ss += g[i] * g[i]
+
+    scale = clip_norm / max(sqrt(ss), clip_norm)
+    if scale < 1.0:
+        for i in prange(n, nogil=True):
+            g[i] *= <param_t>scale
+
+
+def sgd_step(
+    param_t[::1] param,
+    param_t[::1] grad,
+    state_t[::1] mom,
+    double lr,
+    double momentum,
+    bint first,
+):
+    cdef Py_ssize_t i, n = param.shape[0]
+    cdef double m
+
+    for i in prange(n, nogil=True):
+        if first:
+            m = lr * grad[i]
+        else:
+            m = momentum * mom[i] + lr * grad[i]
+        mom[i] = <state_t>m
+        param[i] -= <param_t>m
+
+
+def adagrad_step(
+    param_t[::1] param,
+    param_t[::1] grad,
+    state_t[::1] cache,
+    double lr,
+    double eps,
+    bint first,
+):
+    cdef Py_ssize_t i, n = param.shape[0]
+    cdef double g, c
+
+    for i in prange(n, nogil=True):
+        g = grad[i]
+        if first:
+            c = g * g
+        else:
+            c = cache[i] + g * g
+        cache[i] = <state_t>c
+        param[i] -= <param_t>(lr * g / (sqrt(c) + eps))
+
+
+def rmsprop_step(
+    param_t[::1] param,
+    param_t[::1] grad,
+    state_t[::1] cache,
+    double lr,
+    double decay,
+    double eps,
+    bint first,
+):
+    cdef Py_ssize_t i, n = param.shape[0]
+    cdef double g, c
+
+    for i in prange(n, nogil=True):
+        g = grad[i]
+        if first:
+            c = (1 - decay) * g * g
+        else:
+            c = decay * cache[i] + (1 - decay) * g * g
+        cache[i] = <state_t>c
+        param[i] -= <param_t>(lr * g / (sqrt(c) + eps))
+
+
+def adam_step(
+    param_t[::1] param,
+    param_t[::1] grad,
+    state_t[::1] mean,
+    state_t[::1] var,
+    double lr,
+    double d1,
+    double d2,
+    double eps,
+    double bc1,
+    double bc2,
+    bint first,
+):
+    cdef Py_ssize_t i, n = param.shape[0]
+    cdef double g, m, v
+
+    for i in prange(n, nogil=True):
+        g = grad[i]
+        if first:
+            m = (1 - d1) * g
+            v = (1 - d2) * g * g
+        else:
+            m = d1 * mean[i] + (1 - d1) * g
+            v = d2 * var[i] + (1 - d2) * g * g
+        mean[i] = <state_t>m
+        var[i] = <state_t>v
+        param[i] -= <param_t>(lr * (m / bc1) / (sqrt(v / bc2) + eps))
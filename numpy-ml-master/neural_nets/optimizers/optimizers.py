@@ -1,8 +1,29 @@
+import math
 from copy import deepcopy
 from abc import ABC, abstractmethod
 
 import numpy as np
-from numpy.linalg import norm
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    import optimizer_kernels as _ext
+
+    _HAS_EXT = True
+except ImportError:
+    _HAS_EXT = False
+
+try:
+    from numba import cuda
+
+    _HAS_CUDA = cuda.is_available()
+except Exception:
+    _HAS_CUDA = False
 
 """
 For a discussion regarding the impact of different optimization strategies, see:
@@ -32,19 +53,366 @@ Particularly, the authors find that
          yields significant improvements over its default settings in all cases.
 """
 
+#######################################################################
+#                        Fused Update Kernels                         #
+#######################################################################
+
+"""
+Each optimizer update is a chain of elementwise operations, so evaluating it
+as separate NumPy expressions allocates a full temporary array and makes a
+full pass over memory for every operation. The kernels below fuse each update
+into a single in-place pass over the parameter, gradient, and cache buffers
+(compiled with Numba when it is available; the pure NumPy fallbacks route
+every intermediate through a single reusable scratch buffer, so they perform
+no per-step allocations either).
+
+All kernels operate on 1D contiguous views and mutate `param` and the cache
+buffers in place.
+"""
+
+
+_scratch_cache = {}
+
+
+def _scratch_like(buf):
+    """
+    Return a reusable scratch buffer with the same size and dtype as `buf`.
+    Buffers are allocated once per (size, dtype) and shared across calls so
+    the NumPy fallback kernels stay allocation-free after warmup.
+    """
+    key = (buf.shape[0], buf.dtype.str)
+    scratch = _scratch_cache.get(key)
+    if scratch is None:
+        scratch = _scratch_cache[key] = np.empty_like(buf)
+    return scratch
+
+
+def _maybe_clip_np(g, clip_norm):
+    # np.dot on the flat gradient dispatches to a single BLAS dot, skipping
+    # the abs pass and reshape that np.linalg.norm performs
+    ss = float(np.dot(g, g))
+    # branchless: 1.0 below the threshold, clip_norm / norm above it
+    scale = clip_norm / max(math.sqrt(ss), clip_norm)
+    if scale < 1.0:
+        g *= scale
+
+
+def _sgd_step_np(param, grad, mom, lr, momentum, first):
+    if first:
+        np.multiply(grad, lr, out=mom)
+    else:
+        scratch = _scratch_like(mom)
+        np.multiply(grad, lr, out=scratch)
+        mom *= momentum
+        mom += scratch
+    param -= mom
+
+
+def _adagrad_step_np(param, grad, cache, lr, eps, first):
+    scratch = _scratch_like(cache)
+    if first:
+        np.multiply(grad, grad, out=cache)
+    else:
+        np.multiply(grad, grad, out=scratch)
+        cache += scratch
+    np.sqrt(cache, out=scratch)
+    scratch += eps
+    np.divide(grad, scratch, out=scratch)
+    scratch *= lr
+    param -= scratch
+
+
+def _rmsprop_step_np(param, grad, cache, lr, decay, eps, first):
+    scratch = _scratch_like(cache)
+    if first:
+        np.multiply(grad, grad, out=cache)
+        cache *= 1 - decay
+    else:
+        np.multiply(grad, grad, out=scratch)
+        scratch *= 1 - decay
+        cache *= decay
+        cache += scratch
+    np.sqrt(cache, out=scratch)
+    scratch += eps
+    np.divide(grad, scratch, out=scratch)
+    scratch *= lr
+    param -= scratch
+
+
+def _adam_step_np(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first):
+    scratch = _scratch_like(var)
+    if first:
+        np.multiply(grad, 1 - d1, out=mean)
+        np.multiply(grad, grad, out=var)
+        var *= 1 - d2
+    else:
+        np.multiply(grad, 1 - d1, out=scratch)
+        mean *= d1
+        mean += scratch
+        np.multiply(grad, grad, out=scratch)
+        scratch *= 1 - d2
+        var *= d2
+        var += scratch
+    np.divide(var, bc2, out=scratch)
+    np.sqrt(scratch, out=scratch)
+    scratch += eps
+    np.divide(mean, scratch, out=scratch)
+    scratch *= lr / bc1
+    param -= scratch
+
+
+def _adam_step_half(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first):
+    """
+    Adam step for reduced-precision (e.g., float16) moment buffers: the
+    moments are *stored* at `mean.dtype` but upcast to float32 for the
+    compute, so only the state reads/writes pay the reduced precision.
+    """
+    g = grad.astype(np.float32)
+    if first:
+        m = (1 - d1) * g
+        v = (1 - d2) * g * g
+    else:
+        m = d1 * mean.astype(np.float32) + (1 - d1) * g
+        v = d2 * var.astype(np.float32) + (1 - d2) * g * g
+    mean[:] = m
+    var[:] = v
+    param -= lr * (m / bc1) / (np.sqrt(v / bc2) + eps)
+
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _maybe_clip(g, clip_norm):
+        ss = 0.0
+        for i in prange(g.shape[0]):
+            ss += g[i] * g[i]
+        # branchless: 1.0 below the threshold, clip_norm / norm above it
+        scale = clip_norm / max(np.sqrt(ss), clip_norm)
+        if scale < 1.0:
+            for i in prange(g.shape[0]):
+                g[i] *= scale
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sgd_step(param, grad, mom, lr, momentum, first):
+        for i in prange(param.shape[0]):
+            # `first` is loop-invariant, so LLVM unswitches the branch
+            m = lr * grad[i] if first else momentum * mom[i] + lr * grad[i]
+            mom[i] = m
+            param[i] -= m
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _adagrad_step(param, grad, cache, lr, eps, first):
+        for i in prange(param.shape[0]):
+            g = grad[i]
+            c = g * g if first else cache[i] + g * g
+            cache[i] = c
+            # reciprocal-multiply so fastmath can lower 1/sqrt to rsqrt
+            inv = 1.0 / (np.sqrt(c) + eps)
+            param[i] -= lr * g * inv
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rmsprop_step(param, grad, cache, lr, decay, eps, first):
+        for i in prange(param.shape[0]):
+            g = grad[i]
+            c = (1 - decay) * g * g if first else decay * cache[i] + (1 - decay) * g * g
+            cache[i] = c
+            inv = 1.0 / (np.sqrt(c) + eps)
+            param[i] -= lr * g * inv
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _adam_step(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first):
+        for i in prange(param.shape[0]):
+            g = grad[i]
+            m = (1 - d1) * g if first else d1 * mean[i] + (1 - d1) * g
+            v = (1 - d2) * g * g if first else d2 * var[i] + (1 - d2) * g * g
+            mean[i] = m
+            var[i] = v
+            inv = 1.0 / (np.sqrt(v / bc2) + eps)
+            param[i] -= lr * (m / bc1) * inv
+
+
+else:
+    _maybe_clip = _maybe_clip_np
+    _sgd_step = _sgd_step_np
+    _adagrad_step = _adagrad_step_np
+    _rmsprop_step = _rmsprop_step_np
+    _adam_step = _adam_step_np
+
+if _HAS_EXT:
+    # a compiled optimizer_kernels extension (see optimizer_kernels.pyx)
+    # takes precedence over both the Numba and NumPy paths
+    _maybe_clip = _ext.maybe_clip
+    _sgd_step = _ext.sgd_step
+    _adagrad_step = _ext.adagrad_step
+    _rmsprop_step = _ext.rmsprop_step
+    _adam_step = _ext.adam_step
+
+
+if _HAS_CUDA:
+
+    @cuda.jit
+    def _adam_step_cuda(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first):
+        i = cuda.grid(1)
+        if i < param.shape[0]:
+            g = grad[i]
+            if first:
+                m = (1 - d1) * g
+                v = (1 - d2) * g * g
+            else:
+                m = d1 * mean[i] + (1 - d1) * g
+                v = d2 * var[i] + (1 - d2) * g * g
+            mean[i] = m
+            var[i] = v
+            param[i] -= lr * (m / bc1) / (math.sqrt(v / bc2) + eps)
+
+
+_adam_kernel_cache = {}
+
+
+def _adam_kernel(half_state, clip_on):
+    """
+    Return an Adam step function specialized for a `(half_state, clip_on)`
+    configuration, binding the precision and clipping dispatch once instead
+    of re-checking both flags on every call. Specializations are compiled
+    lazily and cached at module level; underneath, Numba additionally caches
+    one compilation per array-dtype signature.
+    """
+    key = (half_state, clip_on)
+    fn = _adam_kernel_cache.get(key)
+    if fn is None:
+        kernel = _adam_step_half if half_state else _adam_step
+
+        if clip_on:
+
+            def fn(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first, cn):
+                _maybe_clip(grad, cn)
+                kernel(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first)
+
+        else:
+
+            def fn(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first, cn):
+                kernel(param, grad, mean, var, lr, d1, d2, eps, bc1, bc2, first)
+
+        _adam_kernel_cache[key] = fn
+    return fn
+
+
+def _flatten(param, param_grad):
+    """
+    Return 1D contiguous views of `param` and `param_grad` for the fused
+    kernels, copying only when an array is non-contiguous.
+    """
+    param = np.ascontiguousarray(param)
+    param_grad = np.ascontiguousarray(param_grad)
+    return param, param.reshape(-1), param_grad.reshape(-1)
+
+
+def _device_contiguous(x):
+    """
+    Return True if the device array `x` is C-contiguous. Handles both the
+    CuPy-style `flags` attribute and Numba device arrays, which expose an
+    `is_c_contiguous()` method instead.
+    """
+    flags = getattr(x, "flags", None)
+    if flags is not None:
+        return bool(getattr(flags, "c_contiguous", True))
+    is_c = getattr(x, "is_c_contiguous", None)
+    return bool(is_c()) if callable(is_c) else True
+
+
+class BufferPool(object):
+    """
+    A mixin providing preallocated, contiguous optimizer-state buffers.
+
+    State is kept in struct-of-arrays (SoA) form: `cache[param_name]` maps to
+    one or more flat contiguous arrays (e.g., `(mean_buf, var_buf)` for Adam)
+    allocated once on first use and updated in place on every subsequent
+    step. This replaces the per-step dict-of-dicts lookups, keeps the buffers
+    cache-friendly for the fused kernels, and stores state as `state_dtype`
+    (float32 by default) to halve the bytes moved per step relative to the
+    float64 parameter dtype. Integer step counts live in the parallel
+    `self._t` dict so the float buffers stay purely numeric.
+    """
+
+    state_dtype = np.float32
+
+    def _register(self, param_name, n_elts, n_buffers=1):
+        """
+        Allocate `n_buffers` contiguous state buffers of `n_elts` elements
+        for `param_name` on first use; afterwards return the existing
+        buffers. The buffers are left uninitialized -- the first kernel call
+        (signalled via `first`) computes the step as if the state were zero,
+        which skips the full memset pass an explicit zero-fill would cost.
+        """
+        if param_name not in self.cache:
+            bufs = tuple(
+                np.empty(n_elts, dtype=self.state_dtype) for _ in range(n_buffers)
+            )
+            self.cache[param_name] = bufs[0] if n_buffers == 1 else bufs
+            self._t[param_name] = 0
+        return self.cache[param_name]
+
 
 class OptimizerBase(ABC):
-    def __init__(self, lr, scheduler=None):
+    def __init__(self, lr, scheduler=None, accum_steps=1):
         from initializers import SchedulerInitializer
 
         self.cache = {}
+        self._t = {}
         self.cur_step = 0
+        self.accum_steps = accum_steps
+        self._accum_count = {}
+        self._grad_accum = {}
         self.hyperparameters = {}
         self.lr_scheduler = SchedulerInitializer(scheduler, lr=lr)()
+        self._cache_scheduler()
+
+    def _cache_scheduler(self):
+        from schedulers import ConstantScheduler
+
+        # for a constant scheduler the per-step query is pure overhead, so
+        # cache the rate once and skip the call in `_get_lr`
+        self._is_const_lr = isinstance(self.lr_scheduler, ConstantScheduler)
+        self._const_lr = self.lr_scheduler(0) if self._is_const_lr else None
+
+    def _get_lr(self, cur_loss=None):
+        if self._is_const_lr:
+            return self._const_lr
+        return self.lr_scheduler(self.cur_step, cur_loss)
 
     def __call__(self, param, param_grad, param_name, cur_loss=None):
+        if self.accum_steps > 1:
+            param_grad = self._accumulate(param_grad, param_name)
+            if param_grad is None:
+                return param
         return self.update(param, param_grad, param_name, cur_loss)
 
+    def _accumulate(self, param_grad, param_name):
+        """
+        Add `param_grad` to the running sum for `param_name`. Returns the
+        averaged gradient on every `accum_steps`-th call and None otherwise,
+        so the heavy update kernel only runs once per `accum_steps`
+        minibatches.
+        """
+        n = self._accum_count.get(param_name, 0) + 1
+        acc = self._grad_accum.get(param_name)
+        if acc is None:
+            acc = self._grad_accum[param_name] = np.array(
+                param_grad, dtype=param_grad.dtype
+            )
+        elif n == 1:
+            np.copyto(acc, param_grad)
+        else:
+            acc += param_grad
+
+        if n < self.accum_steps:
+            self._accum_count[param_name] = n
+            return None
+
+        self._accum_count[param_name] = 0
+        acc /= self.accum_steps
+        return acc
+
     def step(self):
         self.cur_step += 1
 
@@ -61,8 +429,19 @@ class OptimizerBase(ABC):
             for k, v in hparam_dict.items():
                 if k in self.hyperparameters:
                     self.hyperparameters[k] = v
+                    # keep the cached instance attributes in sync
+                    if hasattr(self, "_" + k):
+                        setattr(self, "_" + k, v)
+                    elif k == "accum_steps":
+                        self.accum_steps = v
+                    elif k == "state_dtype":
+                        # buffers registered after this point pick up the new
+                        # dtype; the dict keeps the string form for repr
+                        self.state_dtype = np.dtype(v)
+                        self.hyperparameters[k] = str(self.state_dtype)
                     if k == "lr_scheduler":
                         self.lr_scheduler = SchedulerInitializer(v, lr=None)()
+                        self._cache_scheduler()
 
         if cache_dict is not None:
             for k, v in cache_dict.items():
@@ -73,10 +452,66 @@ class OptimizerBase(ABC):
     def update(self, param, param_grad, param_name, cur_loss=None):
         raise NotImplementedError
 
+    def _update_one(self, param, param_grad, param_name, lr):
+        """
+        Apply the update for a single parameter given a prefetched learning
+        rate. The built-in optimizers override this with versions that use
+        `lr` directly; the default defers to `update` (which re-queries the
+        scheduler) so `update_all` works for any subclass that only
+        implements the abstract `update` contract.
+        """
+        return self.update(param, param_grad, param_name)
+
+    def update_all(self, params, grads, cur_loss=None):
+        """
+        Apply the optimizer update to every parameter in a single call.
+
+        Calling the optimizer once per parameter re-enters Python, re-reads
+        the hyperparameter dict, and re-queries the lr scheduler for each
+        tensor, which dominates the cost of the fused kernels on small
+        parameters. `update_all` fetches the learning rate once and runs one
+        kernel launch per tensor. Prefer this over per-parameter `__call__`
+        in hot training loops.
+
+        Parameters
+        ----------
+        params : dict of str -> numpy array
+            A map from parameter name to current parameter value.
+        grads : dict of str -> numpy array
+            A map from parameter name to the gradient of the loss with
+            respect to that parameter. Must share keys with `params`.
+        cur_loss : float (default: None)
+            The training or validation loss for the current minibatch. Used
+            for learning rate scheduling e.g., by `KingScheduler`.
 
-class SGD(OptimizerBase):
+        Returns
+        -------
+        updated_params : dict of str -> numpy array
+            A map from parameter name to the updated parameter value. The
+            updates are applied to the arrays in `params` in place.
+        """
+        lr = self._get_lr(cur_loss)
+        updated = {}
+        for name in params:
+            grad = grads[name]
+            if self.accum_steps > 1:
+                grad = self._accumulate(grad, name)
+                if grad is None:
+                    updated[name] = params[name]
+                    continue
+            updated[name] = self._update_one(params[name], grad, name, lr)
+        return updated
+
+
+class SGD(BufferPool, OptimizerBase):
     def __init__(
-        self, lr=0.01, momentum=0.0, clip_norm=None, lr_scheduler=None, **kwargs
+        self,
+        lr=0.01,
+        momentum=0.0,
+        clip_norm=None,
+        lr_scheduler=None,
+        accum_steps=1,
+        **kwargs
     ):
         """
         Stochastic gradient descent optimizer.
@@ -99,14 +534,22 @@ class SGD(OptimizerBase):
         lr_scheduler : str or `SchedulerBase` instance (default: None)
             The learning rate scheduler. If `None`, use a constant learning
             rate equal to `lr`.
+        accum_steps : int (default: 1)
+            The number of update calls over which to accumulate each
+            gradient before applying the averaged update. Values > 1 cut
+            the number of full passes over the parameters and optimizer
+            state by the same factor.
         """
-        super().__init__(lr, lr_scheduler)
+        super().__init__(lr, lr_scheduler, accum_steps)
 
+        self._momentum = momentum
+        self._clip_norm = clip_norm
         self.hyperparameters = {
             "id": "SGD",
             "lr": lr,
             "momentum": momentum,
             "clip_norm": clip_norm,
+            "accum_steps": accum_steps,
             "lr_scheduler": str(self.lr_scheduler),
         }
 
@@ -136,24 +579,23 @@ class SGD(OptimizerBase):
         Returns
         -------
         updated_params : numpy array of shape (n, m)
-            The value of `param` after applying the momentum update
+            The value of `param` after applying the momentum update. The
+            update is applied to `param` in place.
         """
-        C = self.cache
-        H = self.hyperparameters
-        momentum, clip_norm = H["momentum"], H["clip_norm"]
-        lr = self.lr_scheduler(self.cur_step, cur_loss)
+        lr = self._get_lr(cur_loss)
+        return self._update_one(param, param_grad, param_name, lr)
 
-        if param_name not in C:
-            C[param_name] = np.zeros_like(param_grad)
+    def _update_one(self, param, param_grad, param_name, lr):
+        param, flat_param, flat_grad = _flatten(param, param_grad)
 
         # scale gradient to avoid explosion
-        t = np.inf if clip_norm is None else clip_norm
-        if norm(param_grad) > t:
-            param_grad = param_grad * t / norm(param_grad)
+        if self._clip_norm is not None:
+            _maybe_clip(flat_grad, self._clip_norm)
 
-        update = momentum * C[param_name] + lr * param_grad
-        self.cache[param_name] = update
-        return param - update
+        first = param_name not in self.cache
+        mom = self._register(param_name, flat_param.shape[0])
+        _sgd_step(flat_param, flat_grad, mom, lr, self._momentum, first)
+        return param
 
 
 #######################################################################
@@ -161,7 +603,7 @@ class SGD(OptimizerBase):
 #######################################################################
 
 
-class AdaGrad(OptimizerBase):
+class AdaGrad(BufferPool, OptimizerBase):
     """
     A downside of Adagrad ... is that the monotonic learning rate usually
     proves too aggressive and stops learning too early.
@@ -169,7 +611,15 @@ class AdaGrad(OptimizerBase):
     -- Andrej Karpathy
     """
 
-    def __init__(self, lr=0.01, eps=1e-7, clip_norm=None, lr_scheduler=None, **kwargs):
+    def __init__(
+        self,
+        lr=0.01,
+        eps=1e-7,
+        clip_norm=None,
+        lr_scheduler=None,
+        accum_steps=1,
+        **kwargs
+    ):
         """
         AdaGrad optimizer. Weights that receive large gradients will have their
         effective learning rate reduced, while weights that receive small or
@@ -194,15 +644,23 @@ class AdaGrad(OptimizerBase):
         lr_scheduler : str or `SchedulerBase` instance (default: None)
             The learning rate scheduler. If `None`, use a constant learning
             rate equal to `lr`.
+        accum_steps : int (default: 1)
+            The number of update calls over which to accumulate each
+            gradient before applying the averaged update. Values > 1 cut
+            the number of full passes over the parameters and optimizer
+            state by the same factor.
         """
-        super().__init__(lr, lr_scheduler)
+        super().__init__(lr, lr_scheduler, accum_steps)
 
         self.cache = {}
+        self._eps = eps
+        self._clip_norm = clip_norm
         self.hyperparameters = {
             "id": "AdaGrad",
             "lr": lr,
             "eps": eps,
             "clip_norm": clip_norm,
+            "accum_steps": accum_steps,
             "lr_scheduler": str(self.lr_scheduler),
         }
 
@@ -234,30 +692,35 @@ class AdaGrad(OptimizerBase):
         Returns
         -------
         updated_params : numpy array of shape (n, m)
-            The value of `param` after applying the AdaGrad update
+            The value of `param` after applying the AdaGrad update. The
+            update is applied to `param` in place.
         """
-        C = self.cache
-        H = self.hyperparameters
-        eps, clip_norm = H["eps"], H["clip_norm"]
-        lr = self.lr_scheduler(self.cur_step, cur_loss)
+        lr = self._get_lr(cur_loss)
+        return self._update_one(param, param_grad, param_name, lr)
 
-        if param_name not in C:
-            C[param_name] = np.zeros_like(param_grad)
+    def _update_one(self, param, param_grad, param_name, lr):
+        param, flat_param, flat_grad = _flatten(param, param_grad)
 
         # scale gradient to avoid explosion
-        t = np.inf if clip_norm is None else clip_norm
-        if norm(param_grad) > t:
-            param_grad = param_grad * t / norm(param_grad)
+        if self._clip_norm is not None:
+            _maybe_clip(flat_grad, self._clip_norm)
 
-        C[param_name] += param_grad ** 2
-        update = lr * param_grad / (np.sqrt(C[param_name]) + eps)
-        self.cache = C
-        return param - update
+        first = param_name not in self.cache
+        cache = self._register(param_name, flat_param.shape[0])
+        _adagrad_step(flat_param, flat_grad, cache, lr, self._eps, first)
+        return param
 
 
-class RMSProp(OptimizerBase):
+class RMSProp(BufferPool, OptimizerBase):
     def __init__(
-        self, lr=0.001, decay=0.9, eps=1e-7, clip_norm=None, lr_scheduler=None, **kwargs
+        self,
+        lr=0.001,
+        decay=0.9,
+        eps=1e-7,
+        clip_norm=None,
+        lr_scheduler=None,
+        accum_steps=1,
+        **kwargs
     ):
         """
         RMSProp optimizer. A refinement of Adagrad to reduce its aggressive,
@@ -287,16 +750,25 @@ class RMSProp(OptimizerBase):
         lr_scheduler : str or `SchedulerBase` instance (default: None)
             The learning rate scheduler. If `None`, use a constant learning
             rate equal to `lr`.
+        accum_steps : int (default: 1)
+            The number of update calls over which to accumulate each
+            gradient before applying the averaged update. Values > 1 cut
+            the number of full passes over the parameters and optimizer
+            state by the same factor.
         """
-        super().__init__(lr, lr_scheduler)
+        super().__init__(lr, lr_scheduler, accum_steps)
 
         self.cache = {}
+        self._eps = eps
+        self._decay = decay
+        self._clip_norm = clip_norm
         self.hyperparameters = {
             "id": "RMSProp",
             "lr": lr,
             "eps": eps,
             "decay": decay,
             "clip_norm": clip_norm,
+            "accum_steps": accum_steps,
             "lr_scheduler": str(self.lr_scheduler),
         }
 
@@ -327,28 +799,26 @@ class RMSProp(OptimizerBase):
         Returns
         -------
         updated_params : numpy array of shape (n, m)
-            The value of `param` after applying the RMSProp update
+            The value of `param` after applying the RMSProp update. The
+            update is applied to `param` in place.
         """
-        C = self.cache
-        H = self.hyperparameters
-        eps, decay, clip_norm = H["eps"], H["decay"], H["clip_norm"]
-        lr = self.lr_scheduler(self.cur_step, cur_loss)
+        lr = self._get_lr(cur_loss)
+        return self._update_one(param, param_grad, param_name, lr)
 
-        if param_name not in C:
-            C[param_name] = np.zeros_like(param_grad)
+    def _update_one(self, param, param_grad, param_name, lr):
+        param, flat_param, flat_grad = _flatten(param, param_grad)
 
         # scale gradient to avoid explosion
-        t = np.inf if clip_norm is None else clip_norm
-        if norm(param_grad) > t:
-            param_grad = param_grad * t / norm(param_grad)
+        if self._clip_norm is not None:
+            _maybe_clip(flat_grad, self._clip_norm)
 
-        C[param_name] = decay * C[param_name] + (1 - decay) * param_grad ** 2
-        update = lr * param_grad / (np.sqrt(C[param_name]) + eps)
-        self.cache = C
-        return param - update
+        first = param_name not in self.cache
+        cache = self._register(param_name, flat_param.shape[0])
+        _rmsprop_step(flat_param, flat_grad, cache, lr, self._decay, self._eps, first)
+        return param
 
 
-class Adam(OptimizerBase):
+class Adam(BufferPool, OptimizerBase):
     def __init__(
         self,
         lr=0.001,
@@ -357,6 +827,8 @@ class Adam(OptimizerBase):
         eps=1e-7,
         clip_norm=None,
         lr_scheduler=None,
+        state_dtype=np.float32,
+        accum_steps=1,
         **kwargs
     ):
         """
@@ -384,10 +856,27 @@ class Adam(OptimizerBase):
         lr_scheduler : str or `SchedulerBase` instance (default: None)
             The learning rate scheduler. If `None`, use a constant learning
             rate equal to `lr`.
+        state_dtype : numpy dtype (default: np.float32)
+            The dtype used to store the `mean` and `var` moment buffers.
+            `np.float16` halves the memory bandwidth consumed by the
+            optimizer state again; the update is still computed in at least
+            float32 precision.
+        accum_steps : int (default: 1)
+            The number of update calls over which to accumulate each
+            gradient before applying the averaged update. Values > 1 cut
+            the number of full passes over the parameters and optimizer
+            state by the same factor.
         """
-        super().__init__(lr, lr_scheduler)
+        super().__init__(lr, lr_scheduler, accum_steps)
 
         self.cache = {}
+        self.state_dtype = np.dtype(state_dtype)
+        self._d1t = {}
+        self._d2t = {}
+        self._eps = eps
+        self._decay1 = decay1
+        self._decay2 = decay2
+        self._clip_norm = clip_norm
         self.hyperparameters = {
             "id": "Adam",
             "lr": lr,
@@ -395,6 +884,8 @@ class Adam(OptimizerBase):
             "decay1": decay1,
             "decay2": decay2,
             "clip_norm": clip_norm,
+            "state_dtype": str(self.state_dtype),
+            "accum_steps": accum_steps,
             "lr_scheduler": str(self.lr_scheduler),
         }
 
@@ -425,38 +916,100 @@ class Adam(OptimizerBase):
         Returns
         -------
         updated_params : numpy array of shape (n, m)
-            The value of `param` after applying the Adam update
+            The value of `param` after applying the Adam update. The update is
+            applied to `param` (and the `mean` / `var` caches) in place.
         """
-        C = self.cache
-        H = self.hyperparameters
-        d1, d2 = H["decay1"], H["decay2"]
-        eps, clip_norm = H["eps"], H["clip_norm"]
-        lr = self.lr_scheduler(self.cur_step, cur_loss)
-
-        if param_name not in C:
-            C[param_name] = {
-                "t": 0,
-                "mean": np.zeros_like(param_grad),
-                "var": np.zeros_like(param_grad),
-            }
+        lr = self._get_lr(cur_loss)
+        return self._update_one(param, param_grad, param_name, lr)
+
+    def _update_one(self, param, param_grad, param_name, lr):
+        if _HAS_CUDA and cuda.is_cuda_array(param):
+            return self._update_one_cuda(param, param_grad, param_name, lr)
+
+        d1, d2, eps = self._decay1, self._decay2, self._eps
+
+        param, flat_param, flat_grad = _flatten(param, param_grad)
+
+        first = param_name not in self.cache
+        mean, var = self._register(param_name, flat_param.shape[0], n_buffers=2)
+        self._t[param_name] += 1
+
+        # maintain running powers of the decay rates so each bias-correction
+        # denominator costs one multiply per step instead of a pow call
+        p1 = self._d1t[param_name] = self._d1t.get(param_name, 1.0) * d1
+        p2 = self._d2t[param_name] = self._d2t.get(param_name, 1.0) * d2
+        bc1 = 1 - p1
+        bc2 = 1 - p2
+
+        # a kernel specialized for this precision / clipping configuration;
+        # sub-float32 state goes through the upcasting NumPy path since
+        # Numba has no reliable CPU float16 support
+        step = _adam_kernel(mean.dtype.itemsize < 4, self._clip_norm is not None)
+        step(
+            flat_param,
+            flat_grad,
+            mean,
+            var,
+            lr,
+            d1,
+            d2,
+            eps,
+            bc1,
+            bc2,
+            first,
+            self._clip_norm,
+        )
+        return param
 
-        # scale gradient to avoid explosion
-        t = np.inf if clip_norm is None else clip_norm
-        if norm(param_grad) > t:
-            param_grad = param_grad * t / norm(param_grad)
-
-        t = C[param_name]["t"] + 1
-        var = C[param_name]["var"]
-        mean = C[param_name]["mean"]
-
-        # update cache
-        C[param_name]["t"] = t
-        C[param_name]["var"] = d2 * var + (1 - d2) * param_grad ** 2
-        C[param_name]["mean"] = d1 * mean + (1 - d1) * param_grad
-        self.cache = C
-
-        # calc unbiased moment estimates and Adam update
-        v_hat = C[param_name]["var"] / (1 - d2 ** t)
-        m_hat = C[param_name]["mean"] / (1 - d1 ** t)
-        update = lr * m_hat / (np.sqrt(v_hat) + eps)
-        return param - update
+    def _update_one_cuda(self, param, param_grad, param_name, lr):
+        """
+        Adam step for device-resident parameters (e.g., CuPy arrays). The
+        moment buffers are allocated on the device and the fused update runs
+        as a CUDA kernel, so parameters never round-trip through host memory
+        during GPU training.
+        """
+        d1, d2, eps = self._decay1, self._decay2, self._eps
+
+        # reshape on a non-contiguous device array returns a copy, so the
+        # kernel would update the copy and the real `param` would keep its
+        # old values -- refuse rather than lose the update silently
+        if not _device_contiguous(param) or not _device_contiguous(param_grad):
+            raise ValueError(
+                "CUDA updates require C-contiguous device arrays for "
+                "`param` and `param_grad`"
+            )
+
+        flat_param = param.reshape(-1)
+        flat_grad = param_grad.reshape(-1)
+
+        # scale gradient to avoid explosion (elementwise device ops; the
+        # float() reduction is the only host sync per step)
+        if self._clip_norm is not None:
+            ss = float((flat_grad * flat_grad).sum())
+            scale = self._clip_norm / max(math.sqrt(ss), self._clip_norm)
+            if scale < 1.0:
+                flat_grad *= scale
+
+        first = param_name not in self.cache
+        if first:
+            n = flat_param.shape[0]
+            self.cache[param_name] = (
+                cuda.device_array(n, dtype=self.state_dtype),
+                cuda.device_array(n, dtype=self.state_dtype),
+            )
+            self._t[param_name] = 0
+        mean, var = self.cache[param_name]
+
+        self._t[param_name] += 1
+        p1 = self._d1t[param_name] = self._d1t.get(param_name, 1.0) * d1
+        p2 = self._d2t[param_name] = self._d2t.get(param_name, 1.0) * d2
+        bc1 = 1 - p1
+        bc2 = 1 - p2
+
+        n = flat_param.shape[0]
+        threads = 256
+        blocks = (n + threads - 1) // threads
+        _adam_step_cuda[blocks, threads](
+            flat_param, flat_grad, mean, var, lr, d1, d2, eps, bc1, bc2, first
+        )
+        return param
@@ -66,7 +66,7 @@ class DecisionTree:
         if classifier and criterion == "mse":
             raise ValueError("`mse` is a valid criterion only when classifier = False.")
 
-    def fit(self, X, Y):
+    def fit(self, X, Y, indices=None):
         """
         Trains a binary decision tree classifier.
 
@@ -78,10 +78,18 @@ class DecisionTree:
             An array of integer labels ranging between [0, n_classes-1] for
             each example in X if `self.classifier`=True else the set of target
             values for each example in X.
+        indices : numpy array of shape (n,) (default: None)
+            The row indices of `X` / `Y` to train on, with repeats allowed
+            (e.g., a bootstrap sample). If None, train on all rows. Rows are
+            gathered lazily one feature column at a time during the split
+            search, so no `(n, M)` copy of `X` is ever materialized.
         """
-        self.n_classes = max(Y) + 1 if self.classifier else None
+        if indices is None:
+            indices = np.arange(X.shape[0])
+
+        self.n_classes = max(Y[indices]) + 1 if self.classifier else None
         self.n_feats = X.shape[1] if not self.n_feats else min(self.n_feats, X.shape[1])
-        self.root = self._grow(X, Y)
+        self.root = self._grow(X, Y, indices)
 
     def predict(self, X):
         """
@@ -118,47 +126,51 @@ class DecisionTree:
         assert self.classifier, "`predict_class_probs` undefined for classifier = False"
         return np.array([self._traverse(x, self.root, prob=True) for x in X])
 
-    def _grow(self, X, Y):
+    def _grow(self, X, Y, idxs):
+        y = Y[idxs]
+
         # if all labels are the same, return a leaf
-        if len(set(Y)) == 1:
+        if len(set(y)) == 1:
             if self.classifier:
                 prob = np.zeros(self.n_classes)
-                prob[Y[0]] = 1.0
-            return Leaf(prob) if self.classifier else Leaf(Y[0])
+                prob[y[0]] = 1.0
+            return Leaf(prob) if self.classifier else Leaf(y[0])
 
         # if we have reached max_depth, return a leaf
         if self.depth >= self.max_depth:
-            v = np.mean(Y, axis=0)
+            v = np.mean(y, axis=0)
             if self.classifier:
-                v = np.bincount(Y, minlength=self.n_classes) / len(Y)
+                v = np.bincount(y, minlength=self.n_classes) / len(y)
             return Leaf(v)
 
-        N, M = X.shape
+        M = X.shape[1]
         self.depth += 1
         feat_idxs = np.random.choice(M, self.n_feats, replace=False)
 
         # greedily select the best split according to `criterion`
-        feat, thresh = self._segment(X, Y, feat_idxs)
-        l = np.argwhere(X[:, feat] <= thresh).flatten()
-        r = np.argwhere(X[:, feat] > thresh).flatten()
+        feat, thresh = self._segment(X, y, idxs, feat_idxs)
+        vals = X[idxs, feat]
+        l = idxs[vals <= thresh]
+        r = idxs[vals > thresh]
 
         # grow the children that result from the split
-        left = self._grow(X[l, :], Y[l])
-        right = self._grow(X[r, :], Y[r])
+        left = self._grow(X, Y, l)
+        right = self._grow(X, Y, r)
         return Node(left, right, (feat, thresh))
 
-    def _segment(self, X, Y, feat_idxs):
+    def _segment(self, X, y, idxs, feat_idxs):
         """
         Find the optimal split rule (feature index and split threshold) for the
-        data according to `self.criterion`.
+        data according to `self.criterion`. Only the candidate feature columns
+        are gathered from `X`, one at a time.
         """
         best_gain = -np.inf
         split_idx, split_thresh = None, None
         for i in feat_idxs:
-            vals = X[:, i]
+            vals = X[idxs, i]
             levels = np.unique(vals)
             thresholds = (levels[:-1] + levels[1:]) / 2
-            gains = np.array([self._impurity_gain(Y, t, vals) for t in thresholds])
+            gains = np.array([self._impurity_gain(y, t, vals) for t in thresholds])
 
             if gains.max() > best_gain:
                 split_idx = i
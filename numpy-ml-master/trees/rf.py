@@ -1,5 +1,19 @@
 import numpy as np
-from dt import DecisionTree
+from dt import DecisionTree, Leaf
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    from joblib import Parallel, delayed
+
+    _HAS_JOBLIB = True
+except ImportError:
+    _HAS_JOBLIB = False
 
 
 def bootstrap_sample(X, Y):
@@ -8,13 +22,105 @@ def bootstrap_sample(X, Y):
     return X[idxs], Y[idxs]
 
 
+def _fit_one_tree(X, Y, n_feats, max_depth, criterion, classifier, seed):
+    """
+    Bootstrap a sample of (X, Y) and fit a single decision tree on it. Kept
+    at module level so worker processes can unpickle it during parallel
+    `RandomForest.fit`; `seed` gives each tree an independent random stream.
+    """
+    np.random.seed(seed)
+    idxs = np.random.choice(X.shape[0], X.shape[0], replace=True)
+    tree = DecisionTree(
+        n_feats=n_feats,
+        max_depth=max_depth,
+        criterion=criterion,
+        classifier=classifier,
+    )
+    # pass the bootstrap as indices so no per-tree copy of X is made
+    tree.fit(X, Y, indices=idxs)
+    return tree
+
+
+def _flatten_tree(root):
+    """
+    Flatten a fitted decision tree into parallel struct-of-arrays lists
+    `(feature, threshold, left, right, value)` indexed by node id, with the
+    root at id 0. Leaves have `left == right == -1`; for classifier trees
+    `value` holds the argmax class label, otherwise the leaf mean.
+    """
+    feature, threshold, left, right, value = [], [], [], [], []
+
+    def walk(node):
+        idx = len(feature)
+        feature.append(-1)
+        threshold.append(0.0)
+        left.append(-1)
+        right.append(-1)
+        value.append(0.0)
+
+        if isinstance(node, Leaf):
+            v = node.value
+            value[idx] = float(np.argmax(v)) if np.ndim(v) else float(v)
+            return idx
+
+        feature[idx] = node.feature
+        threshold[idx] = node.threshold
+        left[idx] = walk(node.left)
+        right[idx] = walk(node.right)
+        return idx
+
+    walk(root)
+    return feature, threshold, left, right, value
+
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _predict_forest(X, feature, threshold, left, right, value, preds):
+        N = X.shape[0]
+        T = feature.shape[0]
+        for i in prange(N):
+            for t in range(T):
+                node = 0
+                while left[t, node] != -1:
+                    if X[i, feature[t, node]] <= threshold[t, node]:
+                        node = left[t, node]
+                    else:
+                        node = right[t, node]
+                preds[t, i] = value[t, node]
+
+
+else:
+
+    def _predict_forest(X, feature, threshold, left, right, value, preds):
+        # vectorized level-wise traversal: advance every still-active sample
+        # one level per iteration rather than recursing per sample
+        N = X.shape[0]
+        rows = np.arange(N)
+        for t in range(feature.shape[0]):
+            node = np.zeros(N, dtype=np.intp)
+            active = left[t, node] != -1
+            while active.any():
+                cur = node[active]
+                go_left = X[rows[active], feature[t, cur]] <= threshold[t, cur]
+                node[active] = np.where(go_left, left[t, cur], right[t, cur])
+                active = left[t, node] != -1
+            preds[t] = value[t, node]
+
+
 class RandomForest:
     """
     A random forest of decision trees.
     """
 
     def __init__(
-        self, n_trees, max_depth, n_feats, classifier=True, criterion="entropy"
+        self,
+        n_trees,
+        max_depth,
+        n_feats,
+        classifier=True,
+        criterion="entropy",
+        n_jobs=None,
     ):
         """
         An ensemble (forest) of decision trees where each split is calculated
@@ -32,6 +138,10 @@ class RandomForest:
         criterion : str (default: 'entropy')
             The error criterion to use when calculating splits. Valid entries
             are {'entropy', 'gini'}.
+        n_jobs : int (default: None)
+            The number of processes to fit trees across. Trees are
+            independent, so training scales roughly linearly with cores. If
+            `None` or 1, fit sequentially; -1 uses all available cores.
         """
         self.trees = []
         self.n_trees = n_trees
@@ -39,23 +149,61 @@ class RandomForest:
         self.max_depth = max_depth
         self.criterion = criterion
         self.classifier = classifier
+        self.n_jobs = n_jobs
+        self._soa = None
 
     def fit(self, X, Y):
         """
         Create `n_trees`-worth of bootstrapped samples from the training data
-        and use each to fit a separate decision tree.
+        and use each to fit a separate decision tree, in parallel across
+        `n_jobs` processes when requested.
         """
-        self.trees = []
-        for _ in range(self.n_trees):
-            X_samp, Y_samp = bootstrap_sample(X, Y)
-            tree = DecisionTree(
-                n_feats=self.n_feats,
-                max_depth=self.max_depth,
-                criterion=self.criterion,
-                classifier=self.classifier,
+        self._soa = None
+        seeds = np.random.randint(0, 2 ** 31 - 1, size=self.n_trees)
+        args = [
+            (X, Y, self.n_feats, self.max_depth, self.criterion, self.classifier, s)
+            for s in seeds
+        ]
+
+        if self.n_jobs is None or self.n_jobs == 1:
+            self.trees = [_fit_one_tree(*a) for a in args]
+        elif _HAS_JOBLIB:
+            # joblib memory-maps large X/Y so workers share pages
+            self.trees = Parallel(n_jobs=self.n_jobs)(
+                delayed(_fit_one_tree)(*a) for a in args
             )
-            tree.fit(X_samp, Y_samp)
-            self.trees.append(tree)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = None if self.n_jobs == -1 else self.n_jobs
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                self.trees = list(ex.map(_fit_one_tree, *zip(*args)))
+        self._flatten_trees()
+
+    def _flatten_trees(self):
+        """
+        Pack all fitted trees into padded `(n_trees, max_nodes)` struct-of-
+        arrays so `predict` can traverse them without any Python dispatch.
+        """
+        flat = [_flatten_tree(t.root) for t in self.trees]
+        n_nodes = max(len(f[0]) for f in flat)
+        T = len(flat)
+
+        feature = np.full((T, n_nodes), -1, dtype=np.intp)
+        threshold = np.zeros((T, n_nodes), dtype=np.float64)
+        left = np.full((T, n_nodes), -1, dtype=np.intp)
+        right = np.full((T, n_nodes), -1, dtype=np.intp)
+        value = np.zeros((T, n_nodes), dtype=np.float64)
+
+        for t, (f, th, l, r, v) in enumerate(flat):
+            n = len(f)
+            feature[t, :n] = f
+            threshold[t, :n] = th
+            left[t, :n] = l
+            right[t, :n] = r
+            value[t, :n] = v
+
+        self._soa = (feature, threshold, left, right, value)
 
     def predict(self, X):
         """
@@ -71,7 +219,16 @@ class RandomForest:
         y_pred : np.array of shape (N,)
             Model predictions for each entry in X.
         """
-        tree_preds = np.array([[t._traverse(x, t.root) for x in X] for t in self.trees])
+        if self._soa is None:
+            self._flatten_trees()
+
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        feature, threshold, left, right, value = self._soa
+        tree_preds = np.empty((self.n_trees, X.shape[0]), dtype=np.float64)
+        _predict_forest(X, feature, threshold, left, right, value, tree_preds)
+
+        if self.classifier:
+            tree_preds = tree_preds.astype(np.intp)
         return self._vote(tree_preds)
 
     def _vote(self, predictions):
@@ -91,8 +248,12 @@ class RandomForest:
             the decision trees for each problem in X. If classifier is False,
             the average prediction across decision trees on each problem.
         """
-        if self.classifier:
-            out = [np.bincount(x).argmax() for x in predictions.T]
-        else:
-            out = [np.mean(x) for x in predictions.T]
-        return np.array(out)
+        if not self.classifier:
+            return predictions.mean(axis=0)
+
+        # one (N, n_classes) histogram instead of N separate bincount calls
+        preds = predictions.astype(np.intp)
+        N = preds.shape[1]
+        counts = np.zeros((N, preds.max() + 1), dtype=np.int32)
+        np.add.at(counts, (np.arange(N), preds), 1)
+        return counts.argmax(axis=1)